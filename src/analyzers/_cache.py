@@ -0,0 +1,62 @@
+"""In-process response cache for deterministic analyzer runs."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from .base_analyzer import AnalysisResult
+
+
+class LLMCache:
+    """Bounded, time-limited map from analyzer input to its AnalysisResult.
+
+    Hits return the stored object itself, not a copy; callers must not mutate it.
+    """
+
+    def __init__(self, ttl_days: int = 90, max_items: int = 10000):
+        self.ttl = timedelta(days=ttl_days)
+        self.max_items = max_items
+        self._entries: dict[str, tuple[datetime, AnalysisResult[Any]]] = {}
+
+    @staticmethod
+    def make_key(name: str, data: Any) -> str:
+        payload = orjson.dumps(
+            {"name": name, "data": data},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+            default=str,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> AnalysisResult[Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if datetime.now() - cached_at > self.ttl:
+            del self._entries[key]
+            return None
+        return result
+
+    def set(self, key: str, value: AnalysisResult[Any]) -> None:
+        now = datetime.now()
+        self._entries.pop(key, None)
+        self._purge(now)
+        while self._entries and len(self._entries) >= self.max_items:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now, value)
+
+    def _purge(self, now: datetime) -> None:
+        # Entries are kept in insertion order, so the expired ones are at the front.
+        while self._entries:
+            key, (cached_at, _) = next(iter(self._entries.items()))
+            if now - cached_at <= self.ttl:
+                break
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
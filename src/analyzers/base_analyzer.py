@@ -3,17 +3,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Generic, TypeVar
 
+from ._cache import LLMCache
+
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 T = TypeVar("T")
 R = TypeVar("R")
 
 
-class AnalysisStatus(Enum):
+class AnalysisStatus(str, Enum):
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
@@ -21,13 +26,13 @@ class AnalysisStatus(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisResult(Generic[R]):
     status: AnalysisStatus
     result: R | None = None
     insights: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
-    analyzed_at: datetime = field(default_factory=datetime.now)
+    analyzed_at: datetime | None = None
     source: str = ""
     errors: list[str] = field(default_factory=list)
 
@@ -35,40 +40,78 @@ class AnalysisResult(Generic[R]):
 class BaseAnalyzer(ABC, Generic[T, R]):
     name: str = "base_analyzer"
     description: str = "Base analyzer class"
+    logger: logging.Logger = logging.getLogger("analyzer.base_analyzer")
     
-    def __init__(self, config: dict[str, Any] | None = None):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "logger" not in cls.__dict__:
+            cls.logger = logging.getLogger(f"analyzer.{cls.name}")
+    
+    def __init__(self, config: dict[str, Any] | None = None, cache: LLMCache | None = None):
         self.config = config or {}
-        self.logger = logging.getLogger(f"analyzer.{self.name}")
+        self.cache = cache
         self._status = AnalysisStatus.PENDING
     
+    # status and _last_result describe the most recent run() to finish. DailyJobManager
+    # runs model analyses concurrently on one instance, so read per-call outcomes
+    # from the returned AnalysisResult instead.
     @property
     def status(self) -> AnalysisStatus:
         return self._status
     
+    @property
+    def cacheable(self) -> bool:
+        # Only deterministic (temperature 0) completions may be served from cache.
+        return self.cache is not None and self.config.get("llm_temperature") == 0
+    
+    def _cache_key(self, data: T) -> str | None:
+        if self.cache is None or not self.cacheable:
+            return None
+        try:
+            return self.cache.make_key(self.name, data)
+        except Exception as e:
+            self.logger.warning("Analyzer %s could not build a cache key: %s", self.name, e)
+            return None
+    
     @abstractmethod
     async def analyze(self, data: T) -> AnalysisResult[R]:
         pass
     
     async def run(self, data: T) -> AnalysisResult[R]:
         self._status = AnalysisStatus.RUNNING
-        self.logger.info(f"Starting analyzer: {self.name}")
+        self.logger.info("Starting analyzer: %s", self.name)
+        
+        cache = self.cache
+        cache_key = self._cache_key(data)
+        if cache is not None and cache_key is not None:
+            cached: AnalysisResult[R] | None = cache.get(cache_key)
+            if cached is not None:
+                self.logger.info("Analyzer %s served from cache", self.name)
+                self._last_result = cached
+                self._status = AnalysisStatus.SUCCESS
+                return cached
         
         try:
             result = await self.analyze(data)
             result.source = self.name
+            if result.analyzed_at is None:
+                result.analyzed_at = datetime.now()
             self._last_result = result
-            
-            if result.errors:
-                self._status = AnalysisStatus.PARTIAL
-            else:
-                self._status = AnalysisStatus.SUCCESS
-            
-            return result
         except Exception as e:
             self._status = AnalysisStatus.FAILED
-            self.logger.error(f"Analyzer {self.name} failed: {e}")
+            self.logger.error("Analyzer %s failed: %s", self.name, e)
             return AnalysisResult(
                 status=AnalysisStatus.FAILED,
                 errors=[str(e)],
+                analyzed_at=datetime.now(),
                 source=self.name
             )
+        
+        if result.errors:
+            self._status = AnalysisStatus.PARTIAL
+        else:
+            self._status = AnalysisStatus.SUCCESS
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, result)
+        
+        return result
@@ -3,16 +3,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Generic, TypeVar
 
+import aiohttp
+
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 T = TypeVar("T")
 
 
-class CollectorStatus(Enum):
+class CollectorStatus(str, Enum):
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
@@ -20,13 +27,13 @@ class CollectorStatus(Enum):
     PARTIAL = "partial"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CollectorResult(Generic[T]):
     status: CollectorStatus
     data: list[T] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
-    collected_at: datetime = field(default_factory=datetime.now)
+    collected_at: datetime | None = None
     items_count: int = 0
     source: str = ""
     
@@ -38,16 +45,47 @@ class CollectorResult(Generic[T]):
 class BaseCollector(ABC, Generic[T]):
     name: str = "base_collector"
     description: str = "Base collector class"
+    logger: logging.Logger = logging.getLogger("collector.base_collector")
     
-    def __init__(self, config: dict[str, Any] | None = None):
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "logger" not in cls.__dict__:
+            cls.logger = logging.getLogger(f"collector.{cls.name}")
+    
+    def __init__(self, config: dict[str, Any] | None = None, session: aiohttp.ClientSession | None = None):
         self.config = config or {}
-        self.logger = logging.getLogger(f"collector.{self.name}")
+        self.session = session
+        self._owned_session: aiohttp.ClientSession | None = None
+        self.semaphore: asyncio.Semaphore | None = None
         self._status = CollectorStatus.PENDING
     
     @property
     def status(self) -> CollectorStatus:
         return self._status
     
+    # Subclasses send requests through _request/_fetch_json, never _http directly,
+    # so the per-host semaphore bound by DailyJobManager applies to every call.
+    @property
+    def _http(self) -> aiohttp.ClientSession:
+        if self.session is not None and not self.session.closed:
+            return self.session
+        if self._owned_session is None or self._owned_session.closed:
+            self._owned_session = aiohttp.ClientSession()
+        return self._owned_session
+    
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[aiohttp.ClientResponse]:
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(16)
+        async with self.semaphore:
+            async with self._http.request(method, url, **kwargs) as response:
+                yield response
+    
+    async def _fetch_json(self, url: str, **kwargs: Any) -> Any:
+        async with self._request("GET", url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+    
     @abstractmethod
     async def collect(self) -> CollectorResult[T]:
         pass
@@ -58,7 +96,7 @@ class BaseCollector(ABC, Generic[T]):
     
     async def run(self) -> CollectorResult[T]:
         self._status = CollectorStatus.RUNNING
-        self.logger.info(f"Starting collector: {self.name}")
+        self.logger.info("Starting collector: %s", self.name)
         
         try:
             if not await self.validate_config():
@@ -66,6 +104,8 @@ class BaseCollector(ABC, Generic[T]):
             
             result = await self.collect()
             result.source = self.name
+            if result.collected_at is None:
+                result.collected_at = datetime.now()
             
             if result.errors:
                 self._status = CollectorStatus.PARTIAL
@@ -76,15 +116,18 @@ class BaseCollector(ABC, Generic[T]):
             
         except Exception as e:
             self._status = CollectorStatus.FAILED
-            self.logger.error(f"Collector {self.name} failed: {e}")
+            self.logger.error("Collector %s failed: %s", self.name, e)
             return CollectorResult(
                 status=CollectorStatus.FAILED,
                 errors=[str(e)],
+                collected_at=datetime.now(),
                 source=self.name
             )
     
     async def close(self) -> None:
-        pass
+        if self._owned_session is not None and not self._owned_session.closed:
+            await self._owned_session.close()
+        self._owned_session = None
     
     def _create_result(self, data: list[T], errors: list[str] | None = None, metadata: dict[str, Any] | None = None) -> CollectorResult[T]:
         return CollectorResult(
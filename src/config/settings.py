@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Any, Optional
@@ -10,6 +11,11 @@ import yaml
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class CollectorSettings(BaseSettings):
     ai_model_sources: list[str] = Field(default=["openai", "anthropic", "google", "meta", "mistral", "cohere"])
@@ -42,6 +48,7 @@ class SchedulerSettings(BaseSettings):
     report_schedule: str = Field(default="0 10 * * *")
     max_retries: int = Field(default=3)
     retry_delay: int = Field(default=300)
+    collection_ttl_hours: int = Field(default=20)
 
 
 class MemorySettings(BaseSettings):
@@ -97,17 +104,29 @@ class Settings(BaseSettings):
 
 
 def load_settings(config_path: Optional[Path] = None) -> Settings:
+    if config_path and not config_path.exists():
+        config_path = None
+    settings = _load_settings(config_path.resolve() if config_path else None).model_copy(deep=True)
+    return _apply_env_overrides(
+        settings,
+        collector={"github_token": os.getenv("GITHUB_TOKEN"), "hf_token": os.getenv("HUGGINGFACE_TOKEN")},
+        analyzer={"llm_api_key": os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY")},
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings(config_path: Optional[Path]) -> Settings:
     settings_dict: dict[str, Any] = {}
-    if config_path and config_path.exists():
+    if config_path:
         with open(config_path) as f:
-            settings_dict = yaml.safe_load(f) or {}
-    env_settings = {
-        "github_token": os.getenv("GITHUB_TOKEN"),
-        "hf_token": os.getenv("HUGGINGFACE_TOKEN"),
-        "llm_api_key": os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY"),
-    }
-    if settings_dict.get("collector"):
-        for key, value in env_settings.items():
-            if value is not None:
-                settings_dict["collector"][key] = value
+            settings_dict = yaml.load(f, Loader=_YamlLoader) or {}
     return Settings(**settings_dict)
+
+
+def _apply_env_overrides(settings: Settings, **sections: dict[str, Optional[str]]) -> Settings:
+    update: dict[str, Any] = {}
+    for section, values in sections.items():
+        values = {key: value for key, value in values.items() if value is not None}
+        if values:
+            update[section] = getattr(settings, section).model_copy(update=values)
+    return settings.model_copy(update=update) if update else settings
@@ -1,5 +1,6 @@
 """Task scheduler for automated daily analysis."""
 
 from .jobs import DailyJobManager
+from .runner import run_async
 
-__all__ = ["DailyJobManager"]
\ No newline at end of file
+__all__ = ["DailyJobManager", "run_async"]
\ No newline at end of file
@@ -2,98 +2,208 @@ from __future__ import annotations
 """Daily job definitions for scheduled tasks."""
 
 import asyncio
+import functools
+import hashlib
 import logging
-from datetime import datetime
-from typing import Any
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
-from src.analyzers.insight_analyzer import InsightAnalyzer
-from src.analyzers.model_analyzer import ModelStructureAnalyzer
-from src.collectors.ai_model_collector import AIModelCollector
-from src.collectors.arxiv_collector import ArxivCollector
-from src.collectors.github_collector import GitHubCollector
-from src.collectors.huggingface_collector import HuggingFaceCollector
-from src.generators.base_generator import ReportFormat
-from src.generators.insight_report_generator import InsightReportGenerator
-from src.generators.model_report_generator import ModelReportGenerator
-from src.memory.memory_store import MemoryStore
+import orjson
+
+from src.analyzers._cache import LLMCache
+from src.analyzers.base_analyzer import AnalysisStatus
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from src.analyzers.insight_analyzer import InsightAnalyzer
+    from src.analyzers.model_analyzer import ModelStructureAnalyzer
+    from src.collectors.ai_model_collector import AIModelCollector
+    from src.collectors.arxiv_collector import ArxivCollector
+    from src.collectors.github_collector import GitHubCollector
+    from src.collectors.huggingface_collector import HuggingFaceCollector
+    from src.generators.insight_report_generator import InsightReportGenerator
+    from src.generators.model_report_generator import ModelReportGenerator
+    from src.memory.memory_store import MemoryStore
 
 
 class DailyJobManager:
+    _COLLECT_KEYS: dict[str, str] = {"ai_models": "models", "github": "repos", "huggingface": "hf_models", "arxiv": "papers"}
+    _HOST_LIMITS: dict[str, int] = {"ai_models": 8, "github": 16, "huggingface": 16, "arxiv": 8}
+    _COLLECTOR_ATTRS: tuple[str, ...] = ("ai_model_collector", "github_collector", "hf_collector", "arxiv_collector")
+
     def __init__(self, config: dict[str, Any], memory_store: MemoryStore | None = None):
         self.config = config
         self.memory_store = memory_store
         self.logger = logging.getLogger("jobs")
-        self.ai_model_collector = AIModelCollector(config.get("collector", {}))
-        self.github_collector = GitHubCollector(config.get("collector", {}))
-        self.hf_collector = HuggingFaceCollector(config.get("collector", {}))
-        self.arxiv_collector = ArxivCollector(config.get("collector", {}))
-        self.insight_analyzer = InsightAnalyzer(config.get("analyzer", {}))
-        self.model_analyzer = ModelStructureAnalyzer(config.get("analyzer", {}))
-        self.insight_generator = InsightReportGenerator()
-        self.model_generator = ModelReportGenerator()
+        memory_config = config.get("memory", {})
+        self.llm_cache = LLMCache(ttl_days=memory_config.get("retention_days", 90), max_items=memory_config.get("max_memory_items", 10000))
         self._last_collection: dict[str, datetime] = {}
         self._collected_data: dict[str, Any] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._model_report_tasks: dict[int, asyncio.Task[Any]] = {}
+        self._collection_hash: str | None = None
+        self._analyzed_hash: str | None = None
+        self._last_analysis: dict[str, Any] | None = None
+
+    @functools.cached_property
+    def ai_model_collector(self) -> AIModelCollector:
+        from src.collectors.ai_model_collector import AIModelCollector
+        return self._bind_collector(AIModelCollector(self.config.get("collector", {})))
+
+    @functools.cached_property
+    def github_collector(self) -> GitHubCollector:
+        from src.collectors.github_collector import GitHubCollector
+        return self._bind_collector(GitHubCollector(self.config.get("collector", {})))
+
+    @functools.cached_property
+    def hf_collector(self) -> HuggingFaceCollector:
+        from src.collectors.huggingface_collector import HuggingFaceCollector
+        return self._bind_collector(HuggingFaceCollector(self.config.get("collector", {})))
+
+    @functools.cached_property
+    def arxiv_collector(self) -> ArxivCollector:
+        from src.collectors.arxiv_collector import ArxivCollector
+        return self._bind_collector(ArxivCollector(self.config.get("collector", {})))
+
+    @functools.cached_property
+    def insight_analyzer(self) -> InsightAnalyzer:
+        from src.analyzers.insight_analyzer import InsightAnalyzer
+        analyzer = InsightAnalyzer(self.config.get("analyzer", {}))
+        analyzer.cache = self.llm_cache
+        return analyzer
+
+    @functools.cached_property
+    def model_analyzer(self) -> ModelStructureAnalyzer:
+        from src.analyzers.model_analyzer import ModelStructureAnalyzer
+        analyzer = ModelStructureAnalyzer(self.config.get("analyzer", {}))
+        analyzer.cache = self.llm_cache
+        return analyzer
+
+    @functools.cached_property
+    def insight_generator(self) -> InsightReportGenerator:
+        from src.generators.insight_report_generator import InsightReportGenerator
+        return InsightReportGenerator()
 
-    async def run_collection_job(self) -> dict[str, Any]:
+    @functools.cached_property
+    def model_generator(self) -> ModelReportGenerator:
+        from src.generators.model_report_generator import ModelReportGenerator
+        return ModelReportGenerator()
+
+    @property
+    def collectors(self) -> list[Any]:
+        return [getattr(self, attr) for attr in self._COLLECTOR_ATTRS]
+
+    def _bind_collector(self, collector: Any) -> Any:
+        if self._session is not None and not self._session.closed:
+            collector.session = self._session
+        return collector
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily because a ClientSession must be bound to the running event loop;
+        # a session left open by an earlier asyncio.run() is dropped rather than reused.
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=200, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            for collector in self.collectors:
+                collector.session = self._session
+        return self._session
+
+    async def run_collection_job(self, force: bool = False) -> dict[str, Any]:
         self.logger.info("Starting daily collection job")
         start_time = datetime.now()
+        started = time.monotonic()
+        if not force:
+            previous = await self._load_recent_collection(start_time)
+            if previous is not None:
+                self._collected_data = previous["data"]
+                self._collection_hash = previous["hash"]
+                self._last_collection["all"] = datetime.fromisoformat(previous["timestamp"])
+                self.logger.info("Reusing collection from %s", previous["timestamp"])
+                return self._collected_data
         results: dict[str, Any] = {"models": [], "papers": [], "repos": [], "hf_models": [], "errors": []}
-        tasks = [
-            self._safe_collect("ai_models", self.ai_model_collector),
-            self._safe_collect("github", self.github_collector),
-            self._safe_collect("huggingface", self.hf_collector),
-            self._safe_collect("arxiv", self.arxiv_collector)
-        ]
-        collected = await asyncio.gather(*tasks, return_exceptions=True)
-        for name, result in zip(["ai_models", "github", "huggingface", "arxiv"], collected):
+        self._get_session()
+        collected = await self._collect_all()
+        from src.collectors.base_collector import CollectorStatus
+
+        for name, result in zip(self._COLLECT_KEYS, collected):
             if isinstance(result, Exception):
                 results["errors"].append(f"{name}: {result}")
             elif result:
-                if name == "ai_models": results["models"] = result.data
-                elif name == "github": results["repos"] = result.data
-                elif name == "huggingface": results["hf_models"] = result.data
-                elif name == "arxiv": results["papers"] = result.data
+                # BaseCollector.run reports failures as a FAILED result rather than raising.
+                results["errors"].extend(f"{name}: {error}" for error in result.errors)
+                if result.status == CollectorStatus.FAILED and not result.errors:
+                    results["errors"].append(f"{name}: failed")
+                results[self._COLLECT_KEYS[name]] = result.data
         self._collected_data = results
+        self._collection_hash = self._payload_hash(results)
         self._last_collection["all"] = start_time
-        if self.memory_store:
-            await self.memory_store.store(key="last_collection", value={"timestamp": start_time.isoformat(), "counts": {"models": len(results["models"]), "papers": len(results["papers"]), "repos": len(results["repos"]), "hf_models": len(results["hf_models"])}})
-        duration = (datetime.now() - start_time).total_seconds()
-        self.logger.info(f"Collection job completed in {duration:.2f}s")
+        if self.memory_store and self._collection_hash is not None:
+            await self._store_many([
+                (f"collection:{self._collection_hash}", results),
+                ("last_collection", {"hash": self._collection_hash, "timestamp": start_time.isoformat(), "item_types": self._item_types(results), "counts": {"models": len(results["models"]), "papers": len(results["papers"]), "repos": len(results["repos"]), "hf_models": len(results["hf_models"])}}),
+            ])
+        duration = time.monotonic() - started
+        self.logger.info("Collection job completed in %.2fs", duration)
         return results
 
-    async def run_analysis_job(self) -> dict[str, Any]:
+    async def run_analysis_job(self, stream_reports: bool = False) -> dict[str, Any]:
         self.logger.info("Starting daily analysis job")
         start_time = datetime.now()
+        started = time.monotonic()
         if not self._collected_data:
             self.logger.warning("No data available for analysis. Run collection first.")
             return {"error": "No data available"}
+        await self._discard_report_tasks()
+        if self._last_analysis is not None and self._collection_hash is not None and self._collection_hash == self._analyzed_hash:
+            self.logger.info("Collected data unchanged since last analysis, reusing results")
+            return self._last_analysis
         results: dict[str, Any] = {"insights": None, "model_analyses": [], "errors": []}
+        models = self._collected_data.get("hf_models", [])[:5]
+        insight_task = asyncio.create_task(self.insight_analyzer.run(self._collected_data))
+        analyses: dict[int, Any] = {}
+        for next_done in asyncio.as_completed([self._analyze_model(index, model) for index, model in enumerate(models)]):
+            index, model_analysis, error = await next_done
+            if error:
+                results["errors"].append(error)
+            if model_analysis:
+                analyses[index] = model_analysis
+                if stream_reports:
+                    self._model_report_tasks[index] = asyncio.create_task(self._generate_model_report(model_analysis))
         try:
-            insight_result = await self.insight_analyzer.run(self._collected_data)
+            insight_result = await insight_task
             if insight_result.result: results["insights"] = insight_result.result
+            if insight_result.status == AnalysisStatus.FAILED:
+                results["errors"].append(f"Insight analysis: {'; '.join(insight_result.errors) or 'failed'}")
         except Exception as e:
             results["errors"].append(f"Insight analysis: {e}")
-        model_analyses_results = []
-        for model in self._collected_data.get("hf_models", [])[:5]:
-            try:
-                model_data = {"model_info": {"name": model.model_id, "provider": model.author, "type": model.pipeline_tag}, "config": {}}
-                analysis_result = await self.model_analyzer.run(model_data)
-                if analysis_result.result:
-                    results["model_analyses"].append(analysis_result.result)
-                    model_analyses_results.append(analysis_result.result)
-            except Exception as e:
-                self.logger.warning(f"Model analysis failed for {model.model_id}: {e}")
+        model_analyses_results = [analyses[index] for index in sorted(analyses)]
+        results["model_analyses"] = list(model_analyses_results)
         self.model_analyzer._last_results = model_analyses_results
         if self.memory_store:
             insight_count = len(results["insights"].insights) if results.get("insights") and hasattr(results["insights"], 'insights') else 0
-            await self.memory_store.store(key="last_analysis", value={"timestamp": start_time.isoformat(), "insight_count": insight_count, "model_analyses": len(results["model_analyses"])})
-        duration = (datetime.now() - start_time).total_seconds()
-        self.logger.info(f"Analysis job completed in {duration:.2f}s")
+            await self._store_many([("last_analysis", {"timestamp": start_time.isoformat(), "collection_hash": self._collection_hash, "insight_count": insight_count, "model_analyses": len(results["model_analyses"])})])
+        # Only a clean run is memoized, so a transient LLM outage is retried next time.
+        if results["errors"]:
+            self._last_analysis, self._analyzed_hash = None, None
+        else:
+            self._last_analysis, self._analyzed_hash = results, self._collection_hash
+        duration = time.monotonic() - started
+        self.logger.info("Analysis job completed in %.2fs", duration)
         return results
 
     async def run_report_job(self) -> dict[str, Any]:
         self.logger.info("Starting daily report generation job")
-        start_time = datetime.now()
+        started = time.monotonic()
+        from src.generators.base_generator import ReportFormat
+
         results: dict[str, Any] = {"insight_report": None, "model_reports": [], "errors": []}
         analysis_data = getattr(self.insight_analyzer, "_last_result", None)
         if analysis_data and analysis_data.result:
@@ -102,31 +212,129 @@ class DailyJobManager:
                 results["insight_report"] = {"path": str(report.file_path) if report.file_path else None, "title": report.title, "status": report.status.value}
             except Exception as e:
                 results["errors"].append(f"Insight report generation: {e}")
-        for model_analysis in getattr(self.model_analyzer, "_last_results", []):
-            try:
-                report = await self.model_generator.generate(model_analysis, format=ReportFormat.PPT)
-                results["model_reports"].append({"path": str(report.file_path) if report.file_path else None, "model": model_analysis.model_name, "status": report.status.value})
-            except Exception as e:
-                self.logger.warning(f"Model report generation failed: {e}")
-        duration = (datetime.now() - start_time).total_seconds()
-        self.logger.info(f"Report generation completed in {duration:.2f}s")
+        pending, self._model_report_tasks = self._model_report_tasks, {}
+        if pending:
+            # Tasks were started in completion order; report them in model rank order.
+            model_reports = await asyncio.gather(*(pending[index] for index in sorted(pending)))
+        else:
+            model_reports = [await self._generate_model_report(model_analysis) for model_analysis in getattr(self.model_analyzer, "_last_results", [])]
+        results["model_reports"] = [report for report in model_reports if report]
+        duration = time.monotonic() - started
+        self.logger.info("Report generation completed in %.2fs", duration)
         return results
 
     async def run_full_pipeline(self) -> dict[str, Any]:
         self.logger.info("Starting full daily pipeline")
-        start_time = datetime.now()
-        collection = await self.run_collection_job()
-        analysis = await self.run_analysis_job()
-        reports = await self.run_report_job()
-        duration = (datetime.now() - start_time).total_seconds()
+        started = time.monotonic()
+        try:
+            collection = await self.run_collection_job()
+            analysis = await self.run_analysis_job(stream_reports=True)
+            reports = await self.run_report_job()
+        finally:
+            await self._discard_report_tasks()
+        duration = time.monotonic() - started
         return {"collection": collection, "analysis": analysis, "reports": reports, "total_duration_seconds": duration, "completed_at": datetime.now().isoformat()}
 
+    async def _discard_report_tasks(self) -> None:
+        pending, self._model_report_tasks = self._model_report_tasks, {}
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    async def _store_many(self, items: list[tuple[str, Any]]) -> None:
+        # Each job writes once when it finishes; a backend with store_batch can commit them together.
+        if not self.memory_store:
+            return
+        store_batch = getattr(self.memory_store, "store_batch", None)
+        if store_batch is not None:
+            await store_batch(items)
+        else:
+            for key, value in items:
+                await self.memory_store.store(key=key, value=value)
+
+    async def _load_recent_collection(self, now: datetime) -> dict[str, Any] | None:
+        if not self.memory_store:
+            return None
+        previous = await self.memory_store.get("last_collection")
+        if not previous or not previous.get("hash"):
+            return None
+        ttl = timedelta(hours=self.config.get("scheduler", {}).get("collection_ttl_hours", 20))
+        if now - datetime.fromisoformat(previous["timestamp"]) >= ttl:
+            return None
+        data = await self.memory_store.get(f"collection:{previous['hash']}")
+        if not data or data.get("errors"):
+            return None
+        if self._item_types(data) != previous.get("item_types"):
+            self.logger.info("Stored collection did not round-trip with its item types, collecting again")
+            return None
+        return {**previous, "data": data}
+
+    @classmethod
+    def _item_types(cls, payload: dict[str, Any]) -> dict[str, list[str]]:
+        return {key: sorted({f"{type(item).__module__}.{type(item).__qualname__}" for item in payload.get(key, [])}) for key in cls._COLLECT_KEYS.values()}
+
+    def _payload_hash(self, payload: Any) -> str | None:
+        # Items must be dataclasses or JSON-native values. Anything else (plain objects,
+        # ints beyond 64 bits) has no stable encoding, so the payload is left unaddressed
+        # and neither stored for reuse nor memoized.
+        try:
+            encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError as e:
+            self.logger.warning("Collection cannot be content-hashed, skipping reuse: %s", e)
+            return None
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _model_input(model: Any) -> dict[str, Any]:
+        # A fresh dict per call: analyzers may mutate, deep-copy or serialize their input.
+        return {"model_info": {"name": model.model_id, "provider": model.author, "type": model.pipeline_tag}, "config": {}}
+
+    async def _analyze_model(self, index: int, model: Any) -> tuple[int, Any, str | None]:
+        try:
+            analysis_result = await self.model_analyzer.run(self._model_input(model))
+        except Exception as e:
+            self.logger.warning("Model analysis failed for %s: %s", getattr(model, "model_id", model), e)
+            return index, None, f"Model analysis {getattr(model, 'model_id', model)}: {e}"
+        if analysis_result.status == AnalysisStatus.FAILED:
+            return index, None, f"Model analysis {model.model_id}: {'; '.join(analysis_result.errors) or 'failed'}"
+        return index, analysis_result.result, None
+
+    async def _generate_model_report(self, model_analysis: Any) -> dict[str, Any] | None:
+        from src.generators.base_generator import ReportFormat
+
+        try:
+            report = await self.model_generator.generate(model_analysis, format=ReportFormat.PPT)
+        except Exception as e:
+            self.logger.warning("Model report generation failed: %s", e)
+            return None
+        return {"path": str(report.file_path) if report.file_path else None, "model": model_analysis.model_name, "status": report.status.value}
+
+    async def _collect_all(self) -> list[Any]:
+        jobs = list(zip(self._COLLECT_KEYS, self.collectors))
+        # Fresh semaphores per run: asyncio primitives bind to the loop that first waits on them.
+        for name, collector in jobs:
+            collector.semaphore = asyncio.Semaphore(self._HOST_LIMITS.get(name, 8))
+        if sys.version_info < (3, 11):
+            return await asyncio.gather(*(self._safe_collect(name, collector) for name, collector in jobs))
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._safe_collect(name, collector)) for name, collector in jobs]
+        return [task.result() for task in tasks]
+
     async def _safe_collect(self, name: str, collector: Any) -> Any:
         try:
             return await collector.run()
         except Exception as e:
-            self.logger.error(f"Collector {name} failed: {e}")
-            raise
+            self.logger.error("Collector %s failed: %s", name, e)
+            return e
 
     async def cleanup(self) -> None:
-        await self.github_collector.close()
+        await self._discard_report_tasks()
+        for attr in self._COLLECTOR_ATTRS:
+            collector = self.__dict__.get(attr)
+            if collector is not None:
+                await collector.close()
+        if self._session is not None and not self._session.closed and self._session_loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from src.collectors.base_collector import BaseCollector, CollectorStatus
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    async def json(self, content_type=None):
+        return {"ok": True}
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    @asynccontextmanager
+    async def request(self, method, url, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            yield FakeResponse()
+        finally:
+            self.in_flight -= 1
+
+
+class FanOutCollector(BaseCollector):
+    name = "fan_out"
+
+    async def collect(self):
+        data = await asyncio.gather(*(self._fetch_json(f"https://example.test/{i}") for i in range(10)))
+        return self._create_result(data)
+
+    async def validate_config(self):
+        return True
+
+
+async def test_requests_are_bounded_by_semaphore():
+    session = FakeSession()
+    collector = FanOutCollector(session=session)
+    collector.semaphore = asyncio.Semaphore(3)
+    result = await collector.run()
+    assert result.status == CollectorStatus.SUCCESS
+    assert result.items_count == 10
+    assert session.peak == 3
+
+
+def test_subclass_logger_is_named_after_collector():
+    assert FanOutCollector.logger.name == "collector.fan_out"
+
+
+def test_subclass_defined_logger_is_kept():
+    custom = logging.getLogger("custom")
+
+    class CustomLoggerCollector(FanOutCollector):
+        name = "c"
+        logger = custom
+
+    assert CustomLoggerCollector.logger is custom
@@ -0,0 +1,390 @@
+import asyncio
+import sys
+import types
+from dataclasses import dataclass
+from enum import Enum
+
+import orjson
+import pytest
+
+from src.analyzers.base_analyzer import AnalysisResult, AnalysisStatus, BaseAnalyzer
+from src.collectors.base_collector import BaseCollector
+from src.scheduler.jobs import DailyJobManager
+
+
+@dataclass
+class HFModel:
+    model_id: str
+    author: str
+    pipeline_tag: str
+
+
+class StaticCollector(BaseCollector):
+    name = "static"
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+        self.calls = 0
+
+    async def collect(self):
+        self.calls += 1
+        return self._create_result(list(self.items))
+
+    async def validate_config(self):
+        return True
+
+
+@dataclass
+class Insight:
+    insights: list
+
+
+@dataclass
+class ModelAnalysis:
+    model_name: str
+
+
+class InsightStub(BaseAnalyzer):
+    name = "insight_stub"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.fail = False
+
+    async def analyze(self, data):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("llm unavailable")
+        return AnalysisResult(status=AnalysisStatus.SUCCESS, result=Insight(["trend"]))
+
+
+class ModelStub(BaseAnalyzer):
+    name = "model_stub"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.fail = False
+
+    async def analyze(self, data):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("llm unavailable")
+        return AnalysisResult(status=AnalysisStatus.SUCCESS, result=ModelAnalysis(data["model_info"]["name"]))
+
+
+class ContendedCollector(StaticCollector):
+    """Waits on the bound semaphore, which ties it to the running loop."""
+
+    async def collect(self):
+        async def hold():
+            async with self.semaphore:
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(hold() for _ in range(32)))
+        return await super().collect()
+
+
+class FailingCollector(StaticCollector):
+    async def collect(self):
+        self.calls += 1
+        raise RuntimeError("HF API 503")
+
+
+class RankDelayModelStub(ModelStub):
+    """Finishes higher-ranked models last, so completion order is the reverse of rank."""
+
+    async def analyze(self, data):
+        await asyncio.sleep(0.01 if data["model_info"]["name"] == "m0" else 0)
+        return await super().analyze(data)
+
+
+class ReportStatus(Enum):
+    SUCCESS = "success"
+
+
+@dataclass
+class Report:
+    file_path: str
+    title: str
+    status: ReportStatus
+
+
+class GeneratorStub:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = 0
+        self.finished = 0
+
+    async def generate(self, data, format=None):
+        self.started += 1
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        return Report("report.pptx", "report", ReportStatus.SUCCESS)
+
+
+class ObjectStore:
+    """Keeps values as-is, like a pickle-backed store."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def store(self, key, value):
+        self.data[key] = value
+
+    async def get(self, key):
+        return self.data.get(key)
+
+
+class JsonStore(ObjectStore):
+    """Round-trips values through JSON, so dataclass items come back as dicts."""
+
+    async def store(self, key, value):
+        self.data[key] = orjson.dumps(value, default=str)
+
+    async def get(self, key):
+        raw = self.data.get(key)
+        return orjson.loads(raw) if raw is not None else None
+
+
+def make_manager(store, hf_models=None):
+    manager = DailyJobManager({}, store)
+    manager.ai_model_collector = StaticCollector(["gpt"])
+    manager.github_collector = StaticCollector(["repo"])
+    manager.hf_collector = StaticCollector(hf_models if hf_models is not None else [HFModel("m0", "a", "text-generation")])
+    manager.arxiv_collector = StaticCollector(["paper"])
+    manager.insight_analyzer = InsightStub()
+    manager.model_analyzer = ModelStub()
+    manager.insight_generator = GeneratorStub()
+    manager.model_generator = GeneratorStub()
+    return manager
+
+
+class ReportFormat(Enum):
+    PPT = "ppt"
+
+
+@pytest.fixture(autouse=True)
+def report_format_module(monkeypatch):
+    # The report generators live outside this tree; the jobs only need ReportFormat.
+    package = types.ModuleType("src.generators")
+    module = types.ModuleType("src.generators.base_generator")
+    module.ReportFormat = ReportFormat
+    package.base_generator = module
+    monkeypatch.setitem(sys.modules, "src.generators", package)
+    monkeypatch.setitem(sys.modules, "src.generators.base_generator", module)
+
+
+@pytest.fixture
+async def managers():
+    created = []
+
+    def factory(store, hf_models=None):
+        manager = make_manager(store, hf_models)
+        created.append(manager)
+        return manager
+
+    yield factory
+    for manager in created:
+        await manager.cleanup()
+
+
+async def test_collection_is_stored_by_content_hash(managers):
+    store = ObjectStore()
+    manager = managers(store)
+    results = await manager.run_collection_job()
+    pointer = store.data["last_collection"]
+    assert store.data[f"collection:{pointer['hash']}"] is results
+    assert pointer["counts"]["hf_models"] == 1
+
+
+async def test_recent_collection_is_reused_when_items_round_trip(managers):
+    store = ObjectStore()
+    await managers(store).run_collection_job()
+    second = managers(store)
+    data = await second.run_collection_job()
+    assert second.hf_collector.calls == 0
+    assert isinstance(data["hf_models"][0], HFModel)
+
+
+async def test_collection_is_not_reused_when_store_loses_item_types(managers):
+    store = JsonStore()
+    await managers(store).run_collection_job()
+    second = managers(store)
+    data = await second.run_collection_job()
+    assert second.hf_collector.calls == 1
+    assert isinstance(data["hf_models"][0], HFModel)
+
+
+async def test_failed_collector_is_recorded_and_not_reused(managers):
+    store = ObjectStore()
+    first = managers(store)
+    first.hf_collector = FailingCollector([])
+    results = await first.run_collection_job()
+    assert results["errors"] == ["huggingface: HF API 503"]
+    second = managers(store)
+    await second.run_collection_job()
+    assert second.hf_collector.calls == 1
+
+
+async def test_force_always_collects(managers):
+    store = ObjectStore()
+    await managers(store).run_collection_job()
+    second = managers(store)
+    await second.run_collection_job(force=True)
+    assert second.hf_collector.calls == 1
+
+
+async def test_full_pipeline_generates_streamed_reports(managers):
+    manager = managers(ObjectStore())
+    result = await manager.run_full_pipeline()
+    assert [analysis.model_name for analysis in result["analysis"]["model_analyses"]] == ["m0"]
+    assert len(result["reports"]["model_reports"]) == 1
+    assert result["reports"]["insight_report"]["status"] == "success"
+
+
+async def test_failed_pipeline_cancels_streamed_report_tasks(managers, monkeypatch):
+    manager = managers(ObjectStore())
+    manager.model_generator = GeneratorStub(delay=10)
+
+    async def broken_report_job():
+        raise RuntimeError("report job crashed")
+
+    monkeypatch.setattr(manager, "run_report_job", broken_report_job)
+    with pytest.raises(RuntimeError):
+        await manager.run_full_pipeline()
+    assert manager._model_report_tasks == {}
+    assert manager.model_generator.finished == 0
+
+
+async def test_stale_report_tasks_are_dropped_by_next_analysis(managers):
+    manager = managers(ObjectStore())
+    manager.model_generator = GeneratorStub(delay=10)
+    await manager.run_collection_job()
+    await manager.run_analysis_job(stream_reports=True)
+    stale = list(manager._model_report_tasks.values())
+    await asyncio.sleep(0)
+    assert manager.model_generator.started == 1
+    manager._collection_hash = None
+    await manager.run_analysis_job()
+    assert all(task.cancelled() for task in stale)
+    assert manager._model_report_tasks == {}
+
+
+async def test_unchanged_collection_reuses_successful_analysis(managers):
+    manager = managers(ObjectStore())
+    await manager.run_collection_job()
+    first = await manager.run_analysis_job()
+    second = await manager.run_analysis_job()
+    assert second is first
+    assert manager.insight_analyzer.calls == 1
+    assert manager.model_analyzer.calls == 1
+
+
+async def test_failed_analysis_is_recorded_and_not_memoized(managers):
+    manager = managers(ObjectStore())
+    manager.insight_analyzer.fail = True
+    manager.model_analyzer.fail = True
+    await manager.run_collection_job()
+    failed = await manager.run_analysis_job()
+    assert len(failed["errors"]) == 2
+    assert failed["insights"] is None
+    assert failed["model_analyses"] == []
+    manager.insight_analyzer.fail = False
+    manager.model_analyzer.fail = False
+    recovered = await manager.run_analysis_job()
+    assert recovered["errors"] == []
+    assert recovered["insights"] is not None
+    assert manager.insight_analyzer.calls == 2
+    assert manager.model_analyzer.calls == 2
+
+
+class BatchStore(ObjectStore):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def store_batch(self, items):
+        self.batches.append([key for key, _ in items])
+        self.data.update(items)
+
+
+async def test_each_job_flushes_its_writes_as_one_batch(managers, monkeypatch):
+    store = BatchStore()
+    manager = managers(store)
+
+    async def broken_report_job():
+        raise RuntimeError("report job crashed")
+
+    monkeypatch.setattr(manager, "run_report_job", broken_report_job)
+    with pytest.raises(RuntimeError):
+        await manager.run_full_pipeline()
+    pointer = store.data["last_collection"]
+    assert store.batches == [[f"collection:{pointer['hash']}", "last_collection"], ["last_analysis"]]
+    assert store.data["last_analysis"]["collection_hash"] == pointer["hash"]
+
+
+def test_manager_can_collect_on_successive_event_loops():
+    manager = make_manager(ObjectStore())
+    manager.hf_collector = ContendedCollector([HFModel("m0", "a", "text-generation")])
+
+    async def collect_and_capture_session():
+        data = await manager.run_collection_job(force=True)
+        return data, manager._get_session()
+
+    first, first_session = asyncio.run(collect_and_capture_session())
+    second, second_session = asyncio.run(collect_and_capture_session())
+    asyncio.run(first_session.close())
+    asyncio.run(second_session.close())
+    assert first["hf_models"] == second["hf_models"] == [HFModel("m0", "a", "text-generation")]
+    assert second_session is not first_session
+
+
+async def test_streamed_reports_follow_model_rank(managers):
+    models = [HFModel("m0", "a", "text-generation"), HFModel("m1", "b", "text-generation")]
+    manager = managers(ObjectStore(), hf_models=models)
+    manager.model_analyzer = RankDelayModelStub()
+    result = await manager.run_full_pipeline()
+    assert [analysis.model_name for analysis in result["analysis"]["model_analyses"]] == ["m0", "m1"]
+    assert [report["model"] for report in result["reports"]["model_reports"]] == ["m0", "m1"]
+
+
+async def test_memoized_analysis_still_drops_stale_report_tasks(managers):
+    manager = managers(ObjectStore())
+    manager.model_generator = GeneratorStub(delay=10)
+    await manager.run_collection_job()
+    await manager.run_analysis_job(stream_reports=True)
+    stale = list(manager._model_report_tasks.values())
+    await manager.run_analysis_job()
+    assert manager.model_analyzer.calls == 1
+    assert all(task.cancelled() for task in stale)
+    assert manager._model_report_tasks == {}
+
+
+class Opaque:
+    """Has no stable JSON encoding; orjson rejects it instead of falling back to repr()."""
+
+
+@pytest.mark.parametrize("item", [{"stars": 1 << 70}, Opaque()], ids=["wide-int", "plain-object"])
+async def test_unhashable_collection_skips_reuse_and_memo(managers, item):
+    store = ObjectStore()
+    manager = managers(store)
+    manager.github_collector = StaticCollector([item])
+    results = await manager.run_collection_job()
+    assert results["errors"] == []
+    assert manager._collection_hash is None
+    assert store.data == {}
+    await manager.run_analysis_job()
+    await manager.run_analysis_job()
+    assert manager.insight_analyzer.calls == 2
+
+
+def test_model_input_keeps_dict_shape_and_is_not_shared():
+    model = HFModel("m0", "a", "text-generation")
+    first = DailyJobManager._model_input(model)
+    second = DailyJobManager._model_input(model)
+    assert first == {"model_info": {"name": "m0", "provider": "a", "type": "text-generation"}, "config": {}}
+    assert first["config"] is not second["config"]
+    assert orjson.loads(orjson.dumps(first)) == first
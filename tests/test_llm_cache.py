@@ -0,0 +1,99 @@
+import logging
+from datetime import datetime, timedelta
+
+from src.analyzers._cache import LLMCache
+from src.analyzers.base_analyzer import AnalysisResult, AnalysisStatus, BaseAnalyzer
+
+
+class CountingAnalyzer(BaseAnalyzer):
+    name = "counting"
+
+    def __init__(self, config=None, cache=None, fail=False):
+        super().__init__(config, cache)
+        self.calls = 0
+        self.fail = fail
+
+    async def analyze(self, data):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("llm unavailable")
+        return AnalysisResult(status=AnalysisStatus.SUCCESS, result={"echo": data})
+
+
+def test_make_key_is_order_independent():
+    assert LLMCache.make_key("a", {"x": 1, "y": [1, 2]}) == LLMCache.make_key("a", {"y": [1, 2], "x": 1})
+    assert LLMCache.make_key("a", {"x": 1}) != LLMCache.make_key("b", {"x": 1})
+
+
+def test_expired_entries_are_dropped():
+    cache = LLMCache(ttl_days=1)
+    result = AnalysisResult(status=AnalysisStatus.SUCCESS)
+    cache.set("k", result)
+    assert cache.get("k") is result
+    cache._entries["k"] = (datetime.now() - timedelta(days=2), result)
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+async def test_deterministic_run_is_served_from_cache():
+    cache = LLMCache()
+    analyzer = CountingAnalyzer({"llm_temperature": 0}, cache)
+    first = await analyzer.run({"model": "m"})
+    second = await analyzer.run({"model": "m"})
+    assert analyzer.calls == 1
+    assert second is first
+    assert isinstance(second, AnalysisResult)
+    assert second.result == {"echo": {"model": "m"}}
+
+
+async def test_missing_or_nonzero_temperature_is_not_cached():
+    for config in ({}, {"llm_temperature": 0.7}):
+        cache = LLMCache()
+        analyzer = CountingAnalyzer(config, cache)
+        await analyzer.run({"model": "m"})
+        await analyzer.run({"model": "m"})
+        assert analyzer.calls == 2
+        assert len(cache) == 0
+
+
+async def test_failed_run_is_not_cached():
+    cache = LLMCache()
+    analyzer = CountingAnalyzer({"llm_temperature": 0}, cache, fail=True)
+    result = await analyzer.run({"model": "m"})
+    assert result.status == AnalysisStatus.FAILED
+    assert len(cache) == 0
+    analyzer.fail = False
+    result = await analyzer.run({"model": "m"})
+    assert result.status == AnalysisStatus.SUCCESS
+    assert analyzer.calls == 2
+
+
+async def test_unhashable_input_skips_cache_without_failing():
+    cache = LLMCache()
+    analyzer = CountingAnalyzer({"llm_temperature": 0}, cache)
+    result = await analyzer.run({"big": 1 << 70})
+    assert result.status == AnalysisStatus.SUCCESS
+    assert len(cache) == 0
+
+
+def test_analyzer_logger_follows_class_name_unless_overridden():
+    custom = logging.getLogger("custom")
+
+    class CustomLoggerAnalyzer(CountingAnalyzer):
+        name = "c"
+        logger = custom
+
+    assert CountingAnalyzer.logger.name == "analyzer.counting"
+    assert CustomLoggerAnalyzer.logger is custom
+
+
+def test_set_purges_expired_entries_and_caps_size():
+    cache = LLMCache(ttl_days=1, max_items=2)
+    result = AnalysisResult(status=AnalysisStatus.SUCCESS)
+    cache.set("old", result)
+    cache._entries["old"] = (datetime.now() - timedelta(days=2), result)
+    cache.set("a", result)
+    assert "old" not in cache._entries
+    cache.set("b", result)
+    cache.set("c", result)
+    assert list(cache._entries) == ["b", "c"]
@@ -0,0 +1,51 @@
+import asyncio
+import sys
+import types
+
+from src.scheduler import run_async
+
+
+class LoopRecorder:
+    def __init__(self):
+        self.loops = []
+
+    def new_event_loop(self):
+        # Built directly: asyncio.new_event_loop() would go back through the stub policy.
+        loop = asyncio.SelectorEventLoop()
+        self.loops.append(loop)
+        return loop
+
+
+def install_uvloop_stub(monkeypatch):
+    recorder = LoopRecorder()
+    module = types.ModuleType("uvloop")
+    module.new_event_loop = recorder.new_event_loop
+
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        def new_event_loop(self):
+            return recorder.new_event_loop()
+
+    module.EventLoopPolicy = EventLoopPolicy
+    monkeypatch.setitem(sys.modules, "uvloop", module)
+    # Before 3.11 run_async installs the policy globally; restore it after the test.
+    monkeypatch.setattr(asyncio.events, "_event_loop_policy", asyncio.events._event_loop_policy)
+    return recorder
+
+
+def test_run_async_uses_uvloop_when_installed(monkeypatch):
+    recorder = install_uvloop_stub(monkeypatch)
+
+    async def main():
+        return asyncio.get_running_loop()
+
+    loop = run_async(main())
+    assert recorder.loops == [loop]
+
+
+def test_run_async_falls_back_to_asyncio_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def main():
+        return 42
+
+    assert run_async(main()) == 42
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from src.config import load_settings
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+def test_returned_settings_do_not_share_cached_state():
+    first = load_settings(CONFIG_PATH)
+    first.collector.github_repos.append("example/extra")
+    second = load_settings(CONFIG_PATH)
+    assert "example/extra" not in second.collector.github_repos
+    assert len(second.collector.github_repos) == 7
+
+
+def test_missing_config_path_falls_back_to_defaults():
+    settings = load_settings(Path("does/not/exist.yaml"))
+    assert settings.app_name == "AI Insight System"
+    assert settings.data_dir == Path("data")
+
+
+def test_llm_api_key_env_is_applied_to_analyzer(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "anthropic-key")
+    settings = load_settings(CONFIG_PATH)
+    assert settings.analyzer.llm_api_key == "anthropic-key"
+    assert not hasattr(settings.collector, "llm_api_key")
+
+
+def test_openai_key_is_used_when_anthropic_key_is_missing(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "openai-key")
+    assert load_settings(CONFIG_PATH).analyzer.llm_api_key == "openai-key"
+
+
+def test_token_env_overrides_apply_without_reloading(monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("HUGGINGFACE_TOKEN", raising=False)
+    assert load_settings(CONFIG_PATH).collector.github_token is None
+    monkeypatch.setenv("GITHUB_TOKEN", "gh-token")
+    monkeypatch.setenv("HUGGINGFACE_TOKEN", "hf-token")
+    settings = load_settings(CONFIG_PATH)
+    assert settings.collector.github_token == "gh-token"
+    assert settings.collector.hf_token == "hf-token"